@@ -9,229 +9,130 @@ Simple HTTP server to serve the AI-Enhanced OpenVAS GUI
 
 import os
 import sys
+import argparse
+import gzip
+import stat
+import functools
 import json
+import email.utils
 import time
+import zlib
+import socket
+import signal
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-import socketserver
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 
-class AIOpenVASHandler(SimpleHTTPRequestHandler):
-    """Custom HTTP handler for AI-Enhanced OpenVAS GUI"""
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=os.path.dirname(__file__), **kwargs)
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        parsed_path = urlparse(self.path)
-        
-        # API endpoints
-        if parsed_path.path.startswith('/api/'):
-            self.handle_api_request('GET', parsed_path)
-        else:
-            # Serve static files
-            super().do_GET()
-    
-    def do_POST(self):
-        """Handle POST requests"""
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path.startswith('/api/'):
-            self.handle_api_request('POST', parsed_path)
-        else:
-            self.send_error(404)
-    
-    def do_PUT(self):
-        """Handle PUT requests"""
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path.startswith('/api/'):
-            self.handle_api_request('PUT', parsed_path)
-        else:
-            self.send_error(404)
-    
-    def do_DELETE(self):
-        """Handle DELETE requests"""
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path.startswith('/api/'):
-            self.handle_api_request('DELETE', parsed_path)
-        else:
-            self.send_error(404)
-    
-    def handle_api_request(self, method, parsed_path):
-        """Handle API requests with mock responses"""
-        path = parsed_path.path
-        query = parse_qs(parsed_path.query)
-        
-        # Read request body for POST/PUT
-        content_length = int(self.headers.get('Content-Length', 0))
-        request_body = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else ''
-        
-        try:
-            # Mock API responses
-            response_data = self.get_mock_response(method, path, query, request_body)
-            
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-            self.end_headers()
-            
-            self.wfile.write(json.dumps(response_data).encode('utf-8'))
-            
-        except Exception as e:
-            self.send_error(500, f"API Error: {str(e)}")
-    
-    def do_OPTIONS(self):
-        """Handle OPTIONS requests for CORS"""
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-        self.end_headers()
-    
-    def get_mock_response(self, method, path, query, body):
-        """Generate mock API responses"""
-        
-        # Service status
-        if path == '/api/v1/service/status':
-            return {
-                "status": "running",
-                "uptime": 86400,
-                "version": "1.0.0",
-                "components": {
-                    "ai_service": "running",
-                    "cache": "running",
-                    "rate_limiter": "running",
-                    "monitoring": "running"
-                }
-            }
-        
-        # Providers
-        elif path == '/api/v1/providers':
-            if method == 'GET':
-                return {
-                    "providers": [
-                        {
-                            "id": "openai-1",
-                            "name": "OpenAI GPT-4",
-                            "type": "openai",
-                            "status": "healthy",
-                            "model": "gpt-4",
-                            "requests_sent": 1247,
-                            "success_rate": 98.5,
-                            "avg_response_time": 1850,
-                            "last_used": "2025-01-20T10:30:00Z"
-                        },
-                        {
-                            "id": "claude-1",
-                            "name": "Claude 3 Sonnet",
-                            "type": "claude",
-                            "status": "healthy",
-                            "model": "claude-3-sonnet-20240229",
-                            "requests_sent": 892,
-                            "success_rate": 97.2,
-                            "avg_response_time": 2100,
-                            "last_used": "2025-01-20T09:15:00Z"
-                        }
-                    ]
-                }
-            elif method == 'POST':
-                return {"success": True, "message": "Provider added successfully"}
-        
-        # Metrics
-        elif path == '/api/v1/metrics':
-            return {
-                "total_requests": 2139,
-                "successful_requests": 2089,
-                "failed_requests": 50,
-                "success_rate": 97.7,
-                "avg_response_time": 1950,
-                "cache_hit_rate": 23.4,
-                "requests_per_minute": 12.5
-            }
-        
-        # Request history
-        elif path == '/api/v1/requests/history':
-            return {
-                "requests": [
-                    {
-                        "id": "req-001",
-                        "provider": "openai",
-                        "task_type": "vulnerability_analysis",
-                        "status": "success",
-                        "response_time": 1650,
-                        "confidence": 0.92,
-                        "timestamp": "2025-01-20T10:45:00Z"
-                    },
-                    {
-                        "id": "req-002",
-                        "provider": "claude",
-                        "task_type": "threat_modeling",
-                        "status": "success",
-                        "response_time": 2200,
-                        "confidence": 0.88,
-                        "timestamp": "2025-01-20T10:40:00Z"
-                    }
-                ]
-            }
-        
-        # AI Requests
-        elif path == '/api/v1/requests' and method == 'POST':
-            request_data = json.loads(body) if body else {}
-            return {
-                "id": f"req-{int(time.time())}",
-                "status": "success",
-                "response_time": 1500 + (hash(str(request_data)) % 1000),
-                "confidence": 0.8 + (hash(str(request_data)) % 20) / 100,
-                "result": {
-                    "content": self.generate_mock_ai_response(request_data.get('task_type', 'vulnerability_analysis')),
-                    "provider": request_data.get('provider', 'openai')
-                },
-                "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
-            }
-        
-        # Logs
-        elif path == '/api/v1/logs':
-            return {
-                "logs": [
-                    {
-                        "timestamp": "2025-01-20T10:45:00Z",
-                        "level": "INFO",
-                        "message": "AI service started successfully"
-                    },
-                    {
-                        "timestamp": "2025-01-20T10:44:00Z",
-                        "level": "INFO",
-                        "message": "OpenAI provider health check passed"
-                    },
-                    {
-                        "timestamp": "2025-01-20T10:43:00Z",
-                        "level": "WARN",
-                        "message": "Rate limit approaching for OpenAI provider"
-                    }
-                ]
-            }
-        
-        # Provider test
-        elif path.endswith('/test') and method == 'POST':
-            return {
-                "status": "success",
-                "response_time": 800 + (hash(path) % 400),
-                "message": "Provider test successful"
-            }
-        
-        # Default response
-        return {"success": True, "message": "Mock API response"}
-    
-    def generate_mock_ai_response(self, task_type):
-        """Generate mock AI responses based on task type"""
-        responses = {
-            "vulnerability_analysis": """VULNERABILITY ANALYSIS REPORT
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    # orjson is optional; fall back to the stdlib with the same bytes-in/bytes-out contract
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    json_loads = json.loads
+
+# Static mock payloads, built once at import time
+_SERVICE_STATUS = {
+    "status": "running",
+    "uptime": 86400,
+    "version": "1.0.0",
+    "components": {
+        "ai_service": "running",
+        "cache": "running",
+        "rate_limiter": "running",
+        "monitoring": "running"
+    }
+}
+
+_PROVIDERS = {
+    "providers": [
+        {
+            "id": "openai-1",
+            "name": "OpenAI GPT-4",
+            "type": "openai",
+            "status": "healthy",
+            "model": "gpt-4",
+            "requests_sent": 1247,
+            "success_rate": 98.5,
+            "avg_response_time": 1850,
+            "last_used": "2025-01-20T10:30:00Z"
+        },
+        {
+            "id": "claude-1",
+            "name": "Claude 3 Sonnet",
+            "type": "claude",
+            "status": "healthy",
+            "model": "claude-3-sonnet-20240229",
+            "requests_sent": 892,
+            "success_rate": 97.2,
+            "avg_response_time": 2100,
+            "last_used": "2025-01-20T09:15:00Z"
+        }
+    ]
+}
+
+_PROVIDER_ADDED = {"success": True, "message": "Provider added successfully"}
+
+_METRICS = {
+    "total_requests": 2139,
+    "successful_requests": 2089,
+    "failed_requests": 50,
+    "success_rate": 97.7,
+    "avg_response_time": 1950,
+    "cache_hit_rate": 23.4,
+    "requests_per_minute": 12.5
+}
+
+_REQUEST_HISTORY = {
+    "requests": [
+        {
+            "id": "req-001",
+            "provider": "openai",
+            "task_type": "vulnerability_analysis",
+            "status": "success",
+            "response_time": 1650,
+            "confidence": 0.92,
+            "timestamp": "2025-01-20T10:45:00Z"
+        },
+        {
+            "id": "req-002",
+            "provider": "claude",
+            "task_type": "threat_modeling",
+            "status": "success",
+            "response_time": 2200,
+            "confidence": 0.88,
+            "timestamp": "2025-01-20T10:40:00Z"
+        }
+    ]
+}
+
+_LOGS = {
+    "logs": [
+        {
+            "timestamp": "2025-01-20T10:45:00Z",
+            "level": "INFO",
+            "message": "AI service started successfully"
+        },
+        {
+            "timestamp": "2025-01-20T10:44:00Z",
+            "level": "INFO",
+            "message": "OpenAI provider health check passed"
+        },
+        {
+            "timestamp": "2025-01-20T10:43:00Z",
+            "level": "WARN",
+            "message": "Rate limit approaching for OpenAI provider"
+        }
+    ]
+}
+
+_DEFAULT_RESPONSE = {"success": True, "message": "Mock API response"}
+_DEFAULT_RESPONSE_BODY = json_dumps(_DEFAULT_RESPONSE)
+
+_AI_RESPONSES = {
+    "vulnerability_analysis": """VULNERABILITY ANALYSIS REPORT
 
 RISK ASSESSMENT: HIGH
 This SQL injection vulnerability poses a significant risk to the application and underlying database. The vulnerability allows attackers to manipulate database queries, potentially leading to unauthorized data access, modification, or deletion.
@@ -254,7 +155,7 @@ REMEDIATION RECOMMENDATIONS:
 
 CONFIDENCE: 92%""",
 
-            "threat_modeling": """THREAT MODELING ANALYSIS
+    "threat_modeling": """THREAT MODELING ANALYSIS
 
 IDENTIFIED THREATS:
 1. SQL Injection Attacks
@@ -285,7 +186,7 @@ SECURITY CONTROLS:
 
 CONFIDENCE: 88%""",
 
-            "scan_optimization": """SCAN OPTIMIZATION RECOMMENDATIONS
+    "scan_optimization": """SCAN OPTIMIZATION RECOMMENDATIONS
 
 CURRENT SCAN EFFICIENCY: 67%
 
@@ -306,26 +207,509 @@ PERFORMANCE IMPROVEMENTS:
 - Detection accuracy: Maintained at 95%+
 
 CONFIDENCE: 91%"""
-        }
+}
+
+_DEFAULT_AI_RESPONSE = "AI analysis completed successfully."
+
+# AI report texts JSON-escaped once, for splicing into the AI request template
+_AI_RESPONSE_FRAGMENTS = {task_type: json_dumps(text) for task_type, text in _AI_RESPONSES.items()}
+_DEFAULT_AI_RESPONSE_FRAGMENT = json_dumps(_DEFAULT_AI_RESPONSE)
+_DEFAULT_PROVIDER_FRAGMENT = json_dumps("openai")
+
+_AI_REQUEST_TEMPLATE = (
+    b'{"id":"req-%d","status":"success","response_time":%d,"confidence":%r,'
+    b'"result":{"content":%s,"provider":%s},"timestamp":"%s"}'
+)
+
+_PROVIDER_TEST_TEMPLATE = b'{"status":"success","response_time":%d,"message":"Provider test successful"}'
+
+# (epoch second, ISO-8601 bytes) of the last formatted timestamp
+_timestamp_cache = (0, b"")
+
+def _utc_now():
+    """Return the current epoch second and its ISO-8601 form, formatting at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        # A race here only formats the same second twice
+        cached = _timestamp_cache = (now, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)).encode('ascii'))
+    return cached
+
+# (epoch second, HTTP-date string, encoded Date header line) for the current second
+_http_date_cache = (0, "", b"")
+
+def _http_date_now():
+    """Return the current HTTP date and its Date header line, formatting at most once per second"""
+    global _http_date_cache
+    now = int(time.time())
+    cached = _http_date_cache
+    if cached[0] != now:
+        date = email.utils.formatdate(now, usegmt=True)
+        cached = _http_date_cache = (now, date, b"Date: %s\r\n" % date.encode('ascii'))
+    return cached
+
+# Escapes for control characters in logged request lines, as BaseHTTPRequestHandler does
+_LOG_CONTROL_CHARS = str.maketrans({c: f'\\x{c:02x}' for c in [*range(0x20), *range(0x7f, 0xa0)]})
+
+# Static GUI files up to this size are served from an in-memory gzip cache
+_GZIP_MAX_FILE_SIZE = 64 * 1024
+
+@functools.lru_cache(maxsize=64)
+def _gzip_file(path, mtime_ns):
+    """Gzip a static file once per modification time"""
+    with open(path, 'rb') as f:
+        return gzip.compress(f.read(), compresslevel=6)
+
+# Mock API handlers; each takes the path parameters and a callable returning the raw body,
+# and returns the payload either as a dict or already serialized to JSON bytes
+def _ai_request(params, read_body):
+    body = read_body()
+    request_data = json_loads(body) if body else {}
+    # Stable C-level hash of the raw body drives the synthetic metrics
+    body_hash = zlib.crc32(body)
+    now, timestamp = _utc_now()
+    content = _AI_RESPONSE_FRAGMENTS.get(request_data.get('task_type', 'vulnerability_analysis'), _DEFAULT_AI_RESPONSE_FRAGMENT)
+    provider = json_dumps(request_data['provider']) if 'provider' in request_data else _DEFAULT_PROVIDER_FRAGMENT
+    return _AI_REQUEST_TEMPLATE % (
+        now,
+        1500 + (body_hash % 1000),
+        0.8 + (body_hash % 20) / 100,
+        content,
+        provider,
+        timestamp,
+    )
+
+def _provider_test(params, read_body):
+    return _PROVIDER_TEST_TEMPLATE % (800 + (zlib.crc32(params['provider_id'].encode('utf-8')) % 400))
+
+# Each route maps to a handler, or to a payload that never changes; payload routes must be exact paths
+_ROUTE_TABLE = [
+    ('GET', '/api/v1/service/status', _SERVICE_STATUS),
+    ('GET', '/api/v1/providers', _PROVIDERS),
+    ('POST', '/api/v1/providers', _PROVIDER_ADDED),
+    ('POST', '/api/v1/providers/{provider_id}/test', _provider_test),
+    ('GET', '/api/v1/metrics', _METRICS),
+    ('GET', '/api/v1/requests/history', _REQUEST_HISTORY),
+    ('POST', '/api/v1/requests', _ai_request),
+    ('GET', '/api/v1/logs', _LOGS),
+]
+
+class _RouteNode:
+    """One path segment of the parameterized route trie"""
+    
+    __slots__ = ('children', 'param', 'handlers')
+    
+    def __init__(self):
+        self.children = {}
+        self.param = None  # (name, node) for a {name} segment
+        self.handlers = {}
+
+def _build_routes(table):
+    """Split a route table into an exact-match dict and a trie for patterns with {params}"""
+    exact = {}
+    root = _RouteNode()
+    for method, pattern, handler in table:
+        if not callable(handler):
+            # Static payloads are served from _STATIC_RESPONSES
+            continue
+        if '{' not in pattern:
+            exact[(method, pattern)] = handler
+            continue
+        node = root
+        for segment in pattern.split('/'):
+            if segment[:1] == '{':
+                if node.param is None:
+                    node.param = (segment[1:-1], _RouteNode())
+                node = node.param[1]
+            else:
+                node = node.children.setdefault(segment, _RouteNode())
+        node.handlers[method] = handler
+    return exact, root
+
+_ROUTES, _ROUTE_TRIE = _build_routes(_ROUTE_TABLE)
+
+def _match_route(method, path):
+    """Walk the route trie one path segment at a time; return (handler, params) or (None, None)"""
+    node = _ROUTE_TRIE
+    params = {}
+    for segment in path.split('/'):
+        child = node.children.get(segment)
+        if child is None:
+            if node.param is None or not segment:
+                return None, None
+            name, child = node.param
+            params[name] = segment
+        node = child
+    handler = node.handlers.get(method)
+    return (handler, params) if handler is not None else (None, None)
+
+# Header blocks shared by every API response, encoded once
+_CORS_HEADER_FIELDS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+}
+_CORS_HEADERS = "".join(f"{name}: {value}\r\n" for name, value in _CORS_HEADER_FIELDS.items()).encode('latin-1')
+_API_HEADERS = b"Content-Type: application/json\r\n" + _CORS_HEADERS
+_OPTIONS_HEADERS = _CORS_HEADERS + b"Content-Length: 0\r\n\r\n"
+
+def _mock_response(method, path, read_body):
+    """Dispatch a mock API request to its handler and return the JSON-encoded payload"""
+    handler = _ROUTES.get((method, path))
+    params = {}
+    if handler is None:
+        # Parameterized routes are only checked on an exact-match miss
+        handler, params = _match_route(method, path)
+        if handler is None:
+            return _DEFAULT_RESPONSE_BODY
+    payload = handler(params, read_body)
+    return payload if isinstance(payload, bytes) else json_dumps(payload)
+
+def _prepare_body(body, extra_headers=b""):
+    """Pair a serialized body with the remaining header block, Content-Length included"""
+    return body, _API_HEADERS + extra_headers + b"Content-Length: %d\r\n\r\n" % len(body)
+
+def _prepare_static(payload):
+    """Serialize a static payload into its (identity, gzip) response variants"""
+    raw = json_dumps(payload)
+    compressed = gzip.compress(raw, compresslevel=6)
+    plain = _prepare_body(raw, b"Vary: Accept-Encoding\r\n")
+    if len(compressed) >= len(raw):
+        # Tiny payloads do not shrink; always send them as-is
+        return plain, plain
+    return plain, _prepare_body(compressed, b"Content-Encoding: gzip\r\nVary: Accept-Encoding\r\n")
+
+# Pre-serialized bodies for the routes whose payload never changes
+_STATIC_RESPONSES = {
+    (method, pattern): _prepare_static(payload)
+    for method, pattern, payload in _ROUTE_TABLE
+    if not callable(payload)
+}
+
+class AIOpenVASHandler(SimpleHTTPRequestHandler):
+    """Custom HTTP handler for AI-Enhanced OpenVAS GUI"""
+    
+    # Keep connections open between requests; dashboards poll several endpoints per render
+    protocol_version = 'HTTP/1.1'
+    # Idle keep-alive connections give their worker back after this many seconds
+    timeout = 2
+    # Status line and Server header of precomputed 200 responses
+    ok_status = f"{protocol_version} 200 OK\r\nServer: {SimpleHTTPRequestHandler.server_version} {SimpleHTTPRequestHandler.sys_version}\r\n".encode('latin-1')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=os.path.dirname(__file__), **kwargs)
+    
+    def dispatch_request(self, method):
+        """Route API paths to the mock API and everything else to the static files"""
+        path = self.path.partition('?')[0]
+        
+        # API endpoints
+        if path.startswith('/api/'):
+            self.handle_api_request(method, path)
+        elif method != 'GET':
+            self.send_error(404)
+        elif not self.send_cached_gzip(path):
+            # Serve static files
+            super().do_GET()
+    
+    def do_GET(self):
+        """Handle GET requests"""
+        self.dispatch_request('GET')
+    
+    def do_POST(self):
+        """Handle POST requests"""
+        self.dispatch_request('POST')
+    
+    def do_PUT(self):
+        """Handle PUT requests"""
+        self.dispatch_request('PUT')
+    
+    def do_DELETE(self):
+        """Handle DELETE requests"""
+        self.dispatch_request('DELETE')
+    
+    def send_cached_gzip(self, path):
+        """Serve a small static file from the gzip cache; return False to fall back to the default handler"""
+        if 'gzip' not in self.headers.get('Accept-Encoding', ''):
+            return False
+        # Conditional requests keep the base class's 304 handling
+        if 'If-Modified-Since' in self.headers or 'If-None-Match' in self.headers:
+            return False
         
-        return responses.get(task_type, "AI analysis completed successfully.")
+        file_path = self.translate_path(path)
+        if path.endswith('/'):
+            file_path = os.path.join(file_path, 'index.html')
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        if not stat.S_ISREG(st.st_mode) or st.st_size > _GZIP_MAX_FILE_SIZE:
+            return False
+        
+        try:
+            body = _gzip_file(file_path, st.st_mtime_ns)
+        except OSError:
+            # Unreadable, or removed since the stat; the base handler reports it properly
+            return False
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(file_path))
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+    
+    def copyfile(self, source, outputfile):
+        """Copy static files to the socket with sendfile(2) where possible"""
+        if outputfile is self.wfile:
+            # socket.sendfile falls back to plain sends for non-regular files
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+    
+    def handle_api_request(self, method, path):
+        """Handle API requests with mock responses"""
+        try:
+            # Static endpoints are served from their pre-serialized body
+            static = _STATIC_RESPONSES.get((method, path))
+            if static is not None:
+                plain, gzipped = static
+                response = gzipped if 'gzip' in self.headers.get('Accept-Encoding', '') else plain
+            else:
+                # Mock API responses
+                response = _prepare_body(self.get_mock_response(method, path, self.read_body))
+            response_body, response_headers = response
+            self.send_precomputed(response_headers, response_body)
+            
+        except Exception as e:
+            self.send_error(500, f"API Error: {str(e)}")
+    
+    def do_OPTIONS(self):
+        """Handle OPTIONS requests for CORS"""
+        self.send_precomputed(_OPTIONS_HEADERS)
+    
+    def parse_request(self):
+        """Check body framing for every method before it is dispatched to a do_* handler"""
+        if not super().parse_request():
+            return False
+        # send_error closes the connection, so a refused body never reaches the next request
+        if 'Transfer-Encoding' in self.headers:
+            self.send_error(411, explain="Transfer-Encoding is not supported; send a Content-Length")
+            return False
+        # Duplicate or non-numeric lengths leave the body's end ambiguous
+        content_lengths = self.headers.get_all('Content-Length', ())
+        if len(content_lengths) > 1 or not all(value.isascii() and value.isdigit() for value in content_lengths):
+            self.send_error(400, "Bad Content-Length")
+            return False
+        self.content_length = int(content_lengths[0]) if content_lengths else 0
+        self.body_unread = self.content_length > 0
+        return True
+    
+    def keep_alive_ends(self):
+        """True when this response has to close a connection the client asked to keep open"""
+        if self.close_connection:
+            return False
+        # Nothing read a body that was sent, so its bytes would be parsed as the next request
+        if self.body_unread:
+            return True
+        # Once every pool worker has a connection, keeping this one open idle would starve the next client
+        server = self.server
+        return len(getattr(server, 'connections', ())) >= getattr(server, 'max_workers', sys.maxsize)
+    
+    def send_response(self, code, message=None):
+        """Close the connection after this response when its body went unread or the worker pool is saturated"""
+        super().send_response(code, message)
+        # send_error adds its own Connection: close
+        if code < 400 and self.keep_alive_ends():
+            self.send_header('Connection', 'close')
+    
+    def send_precomputed(self, header_block, body=b''):
+        """Send a 200 response with a precomputed header block, status line and body in a single write"""
+        self.log_request(200)
+        head = self.ok_status + _http_date_now()[2]
+        if self.keep_alive_ends():
+            head += b"Connection: close\r\n"
+            self.close_connection = True
+        self.wfile.write(head + header_block + body)
+    
+    def date_time_string(self, timestamp=None):
+        """Reuse the per-second Date header value; explicit timestamps such as Last-Modified are formatted as usual"""
+        if timestamp is None:
+            return _http_date_now()[1]
+        return super().date_time_string(timestamp)
+    
+    def log_request(self, code='-', size='-'):
+        """Log the access line unless the server was started quiet"""
+        if getattr(self.server, 'access_log', True):
+            super().log_request(code, size)
+    
+    def log_message(self, format, *args):
+        """Write each log line with a single os.write so concurrent workers never interleave"""
+        message = (format % args).translate(_LOG_CONTROL_CHARS)
+        line = f"{self.client_address[0]} - - [{self.log_date_time_string()}] {message}\n"
+        try:
+            os.write(sys.stderr.fileno(), line.encode('utf-8', 'backslashreplace'))
+        except (AttributeError, OSError, ValueError):
+            sys.stderr.write(line)
+    
+    def read_body(self):
+        """Read the request body; only handlers that use it call this"""
+        self.body_unread = False
+        return self.rfile.read(self.content_length) if self.content_length > 0 else b''
+    
+    def get_mock_response(self, method, path, read_body):
+        """Generate mock API responses"""
+        return _mock_response(method, path, read_body)
+
+class AIOpenVASServer(ThreadingHTTPServer):
+    """Threaded HTTP server that dispatches requests onto a bounded worker pool"""
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    # Saturated pools close connections, so clients reconnect in bursts; socketserver's backlog of 5 drops their SYNs
+    request_queue_size = 128
+    
+    def __init__(self, server_address, handler_class, max_workers=None, reuse_port=False, access_log=True):
+        self.reuse_port = reuse_port
+        self.access_log = access_log
+        self.connections = set()
+        # Handlers stop keeping connections alive once there is one per worker
+        self.max_workers = max_workers or (os.cpu_count() or 1) * 4
+        super().__init__(server_address, handler_class)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+    
+    def server_bind(self):
+        """Let several worker processes bind the same port; the kernel balances accept() across them"""
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+    
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool instead of spawning a thread per request"""
+        # Small JSON responses should not wait on Nagle's algorithm and delayed ACKs
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024)
+        request.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.connections.add(request)
+        self.executor.submit(self.process_connection, request, client_address)
+    
+    def process_connection(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            self.connections.discard(request)
+    
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        # Wake workers blocked reading idle keep-alive connections so shutdown does not wait on them
+        for request in list(self.connections):
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+def create_asgi_app():
+    """Build a Starlette ASGI app serving the same GUI files and mock API"""
+    from starlette.applications import Starlette
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+    from starlette.staticfiles import StaticFiles
+    
+    async def api(request):
+        method = request.method
+        if method == 'OPTIONS':
+            return Response(headers=_CORS_HEADER_FIELDS)
+        
+        path = request.url.path
+        static = _STATIC_RESPONSES.get((method, path))
+        if static is not None:
+            body = static[0][0]
+        else:
+            request_body = await request.body()
+            try:
+                body = _mock_response(method, path, lambda: request_body)
+            except Exception as e:
+                # Same 500 as the http.server mode, and still readable by cross-origin callers
+                return Response(f"API Error: {str(e)}", status_code=500, media_type='text/plain',
+                                headers=_CORS_HEADER_FIELDS)
+        return Response(body, media_type='application/json', headers=_CORS_HEADER_FIELDS)
+    
+    return Starlette(routes=[
+        Route('/api/{rest:path}', api, methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS']),
+        Mount('/', StaticFiles(directory=os.path.dirname(os.path.abspath(__file__)), html=True)),
+    ])
+
+def run_asgi(port, access_log=True):
+    """Serve the GUI with uvicorn, which picks uvloop and httptools when they are installed"""
+    try:
+        import uvicorn
+        app = create_asgi_app()
+    except ImportError as e:
+        print(f"ASGI mode requires starlette and uvicorn: {e}")
+        return
+    
+    uvicorn.run(app, host="0.0.0.0", port=port, access_log=access_log)
 
 def main():
     """Main server function"""
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+    parser = argparse.ArgumentParser(description="AI-Enhanced OpenVAS GUI Server")
+    parser.add_argument("port", nargs="?", type=int, default=8080, help="port to listen on (default: 8080)")
+    parser.add_argument("--asgi", action="store_true", help="serve with uvicorn and Starlette instead of http.server")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of http.server worker processes sharing the port, 0 for one per CPU (default: 1)")
+    parser.add_argument("--quiet", action="store_true", help="do not log every request")
+    args = parser.parse_args()
+    if args.workers < 0:
+        parser.error("--workers must be 0 (one per CPU) or a positive number of processes")
+    if args.asgi and args.workers != 1:
+        parser.error("--workers only applies to the http.server mode and cannot be combined with --asgi")
+    port = args.port
+    workers = args.workers or os.cpu_count() or 1
     
     print(f"Starting AI-Enhanced OpenVAS GUI Server on port {port}")
     print(f"GUI available at: http://localhost:{port}")
     print(f"API endpoints available at: http://localhost:{port}/api/v1/")
     print("Press Ctrl+C to stop the server")
     
+    if args.asgi:
+        run_asgi(port, access_log=not args.quiet)
+        return
+    
+    if workers > 1 and not (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')):
+        print("Multiple workers need fork() and SO_REUSEPORT; running a single worker")
+        workers = 1
+    
+    # Fork before any threads exist; every worker binds its own socket to the shared port
+    is_parent = True
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            is_parent = False
+            children = []
+            break
+        children.append(pid)
+    if children:
+        # Stop cleanly on SIGTERM too, so the workers are taken down with the parent
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
     try:
-        with socketserver.TCPServer(("", port), AIOpenVASHandler) as httpd:
+        with AIOpenVASServer(("", port), AIOpenVASHandler, reuse_port=workers > 1, access_log=not args.quiet) as httpd:
             httpd.serve_forever()
     except KeyboardInterrupt:
-        print("\nServer stopped.")
+        if is_parent:
+            print("\nServer stopped.")
     except Exception as e:
         print(f"Server error: {e}")
+    finally:
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            os.waitpid(pid, 0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
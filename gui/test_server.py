@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI-Enhanced OpenVAS GUI server's connection handling
+"""
+
+import http.client
+import os
+import socket
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from server import AIOpenVASHandler, AIOpenVASServer
+
+class PatientHandler(AIOpenVASHandler):
+    """Handler whose idle timeout outlasts any client timeout, so a starved client fails instead of waiting it out"""
+
+    timeout = 60
+
+class ServerTestCase(unittest.TestCase):
+    """Run a quiet server with a small worker pool on an ephemeral port"""
+
+    max_workers = 2
+    client_timeout = 10
+
+    def setUp(self):
+        self.server = AIOpenVASServer(('127.0.0.1', 0), PatientHandler, max_workers=self.max_workers, access_log=False)
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def connect(self):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=self.client_timeout)
+        self.addCleanup(conn.close)
+        return conn
+
+    def request(self, conn, path='/api/v1/service/status'):
+        conn.request('GET', path)
+        response = conn.getresponse()
+        response.read()
+        return response
+
+class KeepAliveStarvationTest(ServerTestCase):
+    """Persistent connections must not starve clients once they outnumber the worker pool"""
+
+    def test_saturated_pool_closes_connections(self):
+        first = self.connect()
+        response = self.request(first)
+        self.assertEqual(response.status, 200)
+        self.assertIsNone(response.getheader('Connection'))
+        # The first connection stays open idle, so the second one fills the pool
+        response = self.request(self.connect())
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader('Connection'), 'close')
+
+    def test_more_persistent_clients_than_workers_are_all_served(self):
+        clients = [self.connect() for _ in range(self.max_workers * 3)]
+        for conn in clients:
+            self.assertEqual(self.request(conn).status, 200)
+        # Earlier clients sit idle; a newcomer must be served long before their idle timeout frees a worker
+        self.assertLess(self.client_timeout, PatientHandler.timeout)
+        self.assertEqual(self.request(self.connect()).status, 200)
+        # Clients whose connection was closed reconnect transparently
+        for conn in clients:
+            self.assertEqual(self.request(conn, '/index.html').status, 200)
+
+class RequestFramingTest(ServerTestCase):
+    """Bodies that are refused or left unread must never be parsed as the next request"""
+
+    max_workers = 4
+
+    # One target per method that answers without reading the request body
+    targets = [
+        ('GET', '/index.html'),
+        ('GET', '/api/v1/service/status'),
+        ('HEAD', '/index.html'),
+        ('POST', '/api/v1/providers'),
+        ('PUT', '/api/v1/providers/openai-1'),
+        ('DELETE', '/api/v1/providers/openai-1'),
+        ('OPTIONS', '/api/v1/providers'),
+    ]
+
+    smuggled = b"GET /api/v1/logs HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+    def exchange(self, data):
+        """Send raw bytes and return the file the responses are read from"""
+        sock = socket.create_connection(('127.0.0.1', self.port), timeout=self.client_timeout)
+        self.addCleanup(sock.close)
+        sock.sendall(data)
+        stream = sock.makefile('rb')
+        self.addCleanup(stream.close)
+        return stream
+
+    def read_response(self, stream, method):
+        """Read one response; return its status line, headers and body"""
+        status = stream.readline()
+        headers = http.client.parse_headers(stream)
+        length = 0 if method == 'HEAD' else int(headers.get('Content-Length', 0))
+        return status, headers, stream.read(length)
+
+    def assert_single_response(self, stream, method, status):
+        line, headers, _ = self.read_response(stream, method)
+        self.assertTrue(line.startswith(b"HTTP/1.1 %d " % status), line)
+        self.assertEqual(headers.get('Connection'), 'close')
+        # The server closed the connection instead of answering the smuggled request
+        self.assertEqual(stream.read(), b'')
+
+    def test_unread_body_closes_connection(self):
+        for method, path in self.targets:
+            with self.subTest(method=method, path=path):
+                stream = self.exchange(
+                    b"%s %s HTTP/1.1\r\nHost: localhost\r\nContent-Length: %d\r\n\r\n"
+                    % (method.encode(), path.encode(), len(self.smuggled)) + self.smuggled)
+                self.assert_single_response(stream, method, 200)
+
+    def test_transfer_encoding_is_refused(self):
+        chunk = b"%x\r\n%s\r\n0\r\n\r\n" % (len(self.smuggled), self.smuggled)
+        for method, path in self.targets:
+            with self.subTest(method=method, path=path):
+                stream = self.exchange(
+                    b"%s %s HTTP/1.1\r\nHost: localhost\r\nTransfer-Encoding: chunked\r\n\r\n"
+                    % (method.encode(), path.encode()) + chunk)
+                self.assert_single_response(stream, method, 411)
+
+    def test_ambiguous_content_length_is_refused(self):
+        for lengths in ([b"5", b"6"], [b"-1"], [b"0x10"]):
+            with self.subTest(lengths=lengths):
+                fields = b"".join(b"Content-Length: %s\r\n" % length for length in lengths)
+                stream = self.exchange(b"POST /api/v1/providers HTTP/1.1\r\nHost: localhost\r\n" + fields + b"\r\n"
+                                       + self.smuggled)
+                self.assert_single_response(stream, 'POST', 400)
+
+    def test_read_body_keeps_connection_open(self):
+        body = b'{"task_type": "threat_modeling"}'
+        stream = self.exchange(
+            b"POST /api/v1/requests HTTP/1.1\r\nHost: localhost\r\nContent-Length: %d\r\n\r\n" % len(body)
+            + body + self.smuggled)
+        for method in ('POST', 'GET'):
+            line, headers, _ = self.read_response(stream, method)
+            self.assertTrue(line.startswith(b"HTTP/1.1 200 "), line)
+            self.assertIsNone(headers.get('Connection'))
+
+if __name__ == '__main__':
+    unittest.main()